@@ -11,17 +11,32 @@ import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from pathlib import Path
-import datetime
 import subprocess
 import threading
 import time
+import functools
+import itertools
+import concurrent.futures
+import collections
+import queue
+import selectors
+import weakref
 import customtkinter as ctk
 import ctypes
-# from ctypes import wintypes # Not strictly needed if not using MonitorFromPoint directly
 import traceback
 import platform
 import json
-from ctypes import wintypes
+import re
+import mmap
+from ctypes import wintypes, byref, sizeof, Structure
+
+# Decided once at import: platform.system() runs uname() internally and is
+# surprisingly slow when re-queried on every call.
+IS_WINDOWS = platform.system() == "Windows"
+
+if IS_WINDOWS:
+    import msvcrt
+    import _winapi  # PeekNamedPipe, used by the pipe reader threads
 
 # ──────────────────────────────────────────────────────────────────────
 # OPTIONAL: drag‑and‑drop support (Windows only, via *windnd*)
@@ -37,38 +52,31 @@ except ImportError:
 # DPI awareness helpers (No changes needed)
 # ──────────────────────────────────────────────────────────────────────
 try:
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         ctypes.windll.shcore.SetProcessDpiAwareness(2)
 except AttributeError:
     try:
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             ctypes.windll.user32.SetProcessDPIAware()
     except AttributeError:
         pass
 
 
-def get_scaling_factor() -> float:
-    # Simplified scaling factor logic (assuming it works as before)
-    if platform.system() != "Windows": return 1.0
+# Resolve the Win32 modules once: every `ctypes.windll.user32` attribute
+# access builds a fresh function proxy, so the handles are cached here.
+_user32 = None
+_shcore = None
+if IS_WINDOWS:
+    _user32 = ctypes.windll.user32
     try:
-        # Attempt modern DPI awareness check first
-        PROCESS_PER_MONITOR_DPI_AWARE = 2
-        shcore = ctypes.windll.shcore
-        dpi = ctypes.c_uint()
-        # Get DPI for the monitor associated with the point (0,0) - usually primary
-        monitor = ctypes.windll.user32.MonitorFromPoint(ctypes.wintypes.POINT(0, 0), 2) # MONITOR_DEFAULTTOPRIMARY
-        shcore.GetDpiForMonitor(monitor, 0, ctypes.byref(dpi), ctypes.byref(dpi)) # MDT_EFFECTIVE_DPI = 0
-        return dpi.value / 96.0
-    except Exception:
-         # Fallback to older method if shcore fails
-        try:
-            hdc = ctypes.windll.user32.GetDC(0)
-            LOGPIXELSX = 88
-            dpi = ctypes.windll.gdi32.GetDeviceCaps(hdc, LOGPIXELSX)
-            ctypes.windll.user32.ReleaseDC(0, hdc)
-            return dpi / 96.0
-        except Exception:
-             return 1.0 # Default if everything fails
+        _shcore = ctypes.windll.shcore
+    except OSError:
+        _shcore = None
+
+
+def get_scaling_factor() -> float:
+    # Single monitor query shared with the taskbar/work-area helpers below.
+    return _query_primary_monitor()[0]
 
 # ──────────────────────────────────────────────────────────────────────
 # Resource helper (No changes needed)
@@ -105,32 +113,57 @@ def load_json_list(fname):
     except Exception as e:
         print(f"[Warning] Could not load {fname} from {path}: {e}")
         return []
-    
+
+
+# Default lists are loaded lazily (and prefetched from __init__ on a worker
+# thread) instead of at import time, so module import no longer pays four
+# open + json.loads passes before the window can even construct.
+@functools.lru_cache(maxsize=None)
+def _get_json_list(fname):
+    return load_json_list(fname)
+
+_DEFAULT_JSON_FILES = (
+    "charset_map.json",
+    "min_length_map.json",
+    "max_length_map.json",
+    "archive_file_map.json",
+)
+
+
+# Length-entry validator: empty (while typing) or a positive integer with no
+# leading zero, capped at 5 digits. A single C-level match replaces the
+# isdigit + int() + compare chain that ran on every keystroke.
+_POSINT_RE = re.compile(r'\A(?:|[1-9]\d{0,4})\Z')
+_posint_match = _POSINT_RE.match  # Bound once; the validator fires per keystroke
+
+# Backend success-signal prefix, cached once for the hot output-drain loop
+_FOUND = "FOUND:"
+_FOUND_LEN = len(_FOUND)
+
+# Tokenizer for parse_pattern: escaped char | wildcard | literal run | trailing backslash
+_PAT_TOKENIZER = re.compile(r'\\(.)|([?*])|([^\\?*]+)|\\')
+
 def parse_pattern(pattern):
-    """Parse the pattern into segments, handling escape characters."""
+    """Parse the pattern into a tuple of segments, handling escape characters."""
     segments = []
-    literal = ""
-    i = 0
-    while i < len(pattern):
-        c = pattern[i]
-        if c == '\\' and i + 1 < len(pattern):
-            next_c = pattern[i + 1]
-            if next_c in ['?', '*', '\\']:
-                literal += next_c
-                i += 1
-            else:
-                literal += c
-        elif c in ['?', '*']:
-            if literal:
-                segments.append(literal)
-                literal = ""
-            segments.append(c)
+    buf = []  # pending literal pieces, joined once per segment
+    for m in _PAT_TOKENIZER.finditer(pattern):
+        esc, wild, run = m.group(1, 2, 3)
+        if run:
+            buf.append(run)
+        elif wild:
+            if buf:
+                segments.append(''.join(buf))
+                buf.clear()
+            segments.append(wild)
+        elif esc is not None:
+            # Only \?, \* and \\ are escapes; any other backslash stays literal
+            buf.append(esc if esc in '?*\\' else '\\' + esc)
         else:
-            literal += c
-        i += 1
-    if literal:
-        segments.append(literal)
-    return segments
+            buf.append('\\')  # lone backslash at end of pattern
+    if buf:
+        segments.append(''.join(buf))
+    return tuple(segments)
 
 def calculate_pattern_properties(segments):
     """Calculate default min length and check for '*' presence."""
@@ -146,11 +179,16 @@ def calculate_pattern_properties(segments):
     return min_len, contains_star
 
 
-# Load default values
-charset_map = load_json_list("charset_map.json")
-min_length_map = load_json_list("min_length_map.json")
-max_length_map = load_json_list("max_length_map.json")
-archive_file_map = load_json_list("archive_file_map.json")
+@functools.lru_cache(maxsize=128)
+def _pattern_props(pattern: str):
+    """Parse *pattern* once and cache (segments, min_len, contains_star).
+
+    The trace callbacks re-analyse the same pattern string on every
+    keystroke; caching keeps typing latency independent of pattern length.
+    """
+    segments = parse_pattern(pattern)
+    min_len, contains_star = calculate_pattern_properties(segments)
+    return segments, min_len, contains_star
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -160,7 +198,7 @@ app_instance = None
 
 CPP_EXECUTABLE_NAME = (
     "ArchivePasswordCrackerCLI.exe"
-    if platform.system() == "Windows"
+    if IS_WINDOWS
     else "ArchivePasswordCrackerCLI"
 )
 CPP_EXECUTABLE_PATH = resource_path(os.path.join("helpers", CPP_EXECUTABLE_NAME))
@@ -170,18 +208,130 @@ SKIP_LIST_PATH = resource_path(os.path.join("helpers", SKIP_LIST_FILENAME))
 # --- END NEW ---
 
 
-def safe_update(cb, *args):
-    """Thread‑safe Tk update"""
-    global app_instance
-    if app_instance and app_instance.winfo_exists():
+@functools.lru_cache(maxsize=4)
+def backend_supports_flag(exe_path, flag: bytes) -> bool:
+    """ True if the backend binary at *exe_path* knows *flag*.
+
+        The committed exe can lag the C++ sources (it is rebuilt by hand
+        via compile_cli.bat, not by CI), and an older build answers an
+        unknown flag with per-run WARN lines while the GUI advertises an
+        option that is silently ignored. A literal scan is sufficient: the
+        argument parser and the usage text both embed the flag string. """
+    try:
+        with open(exe_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(flag) != -1
+    except (OSError, ValueError):
+        return False
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Blocked Bloom filter reader (mirrors the C++ backend's skip_list.bf)
+# ──────────────────────────────────────────────────────────────────────
+_BBF_MAGIC = b"BBF1"
+_BBF_BLOCK_BYTES = 64
+_BBF_BLOCK_BITS = _BBF_BLOCK_BYTES * 8  # 512
+_BBF_HEADER_LEN = len(_BBF_MAGIC) + 2   # magic + k:u8 + log2_blocks:u8
+_MASK64 = (1 << 64) - 1
+
+
+def _fnv1a64(data: bytes) -> int:
+    """FNV-1a 64-bit hash (matches fnv1a_hash in the C++ backend)."""
+    h = 0xcbf29ce484222325
+    for b in data:
+        h = ((h ^ b) * 0x100000001b3) & _MASK64
+    return h
+
+
+def _splitmix64(x: int) -> int:
+    """splitmix64 finalizer; derives h2 from h1 (matches bloom_hash_pair)."""
+    z = (x + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class BlockedBloom:
+    """
+    Read-side view of the C++ backend's blocked Bloom filter file.
+
+    All k probe bits for a key live inside one 64-byte block selected by
+    the top bits of h1, so a membership test touches a single cacheline.
+    The authoritative writer is the C++ CLI; the GUI only uses this for
+    sanity reads of skip_list.bf (e.g. reporting its parameters).
+
+    On-disk format: [magic "BBF1"][k:u8][log2_blocks:u8][64B blocks...]
+    """
+
+    def __init__(self, path):
+        self._f = open(path, 'rb')
         try:
-            app_instance.after(0, cb, *args)
-        except (RuntimeError, tk.TclError):
-            pass # Ignore if window is closing
-        except Exception as e:
-            print(f"safe_update error: {e}")
+            header = self._f.read(_BBF_HEADER_LEN)
+            if len(header) != _BBF_HEADER_LEN or header[:4] != _BBF_MAGIC:
+                raise ValueError(f"Not a blocked Bloom filter file: {path}")
+            self.num_hashes = header[4]
+            self.log2_blocks = header[5]
+            if not 1 <= self.num_hashes <= 20 or self.log2_blocks > 57:
+                raise ValueError(f"Implausible filter parameters in: {path}")
+            self.num_blocks = 1 << self.log2_blocks
+            expected = _BBF_HEADER_LEN + self.num_blocks * _BBF_BLOCK_BYTES
+            if os.fstat(self._f.fileno()).st_size < expected:
+                raise ValueError(f"Truncated blocked Bloom filter file: {path}")
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._f.close()
+            raise
+
+    def contains(self, password: str) -> bool:
+        """True if *password* was (probably) already tried."""
+        h1 = _fnv1a64(password.encode('utf-8'))
+        h2 = _splitmix64(h1)
+        block_idx = (h1 >> (64 - self.log2_blocks)) if self.log2_blocks else 0
+        off = _BBF_HEADER_LEN + block_idx * _BBF_BLOCK_BYTES
+        block = self._mm[off:off + _BBF_BLOCK_BYTES]
+        for i in range(self.num_hashes):
+            bit = (h1 + i * h2) & (_BBF_BLOCK_BITS - 1)
+            if not (block[bit >> 3] >> (bit & 7)) & 1:
+                return False
+        return True
+
+    def size_bytes(self) -> int:
+        return self.num_blocks * _BBF_BLOCK_BYTES
+
+    def close(self):
+        self._mm.close()
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
 
-from ctypes import wintypes, byref, sizeof, Structure
+
+# Weak reference to the running app; avoids the global-dict lookup (and a
+# lingering strong reference) on every safe_update call.
+_app_ref = lambda: None
+
+
+def safe_update(cb, *args):
+    """Thread‑safe Tk update; runs inline when already on the Tk thread."""
+    app = _app_ref()
+    if app is None:
+        return
+    try:
+        if not app.winfo_exists():
+            return
+        if threading.get_ident() == app._tk_thread_id:
+            # Already on the Tk thread: no need for an after(0) round-trip
+            cb(*args)
+        else:
+            app.after(0, cb, *args)
+    except (RuntimeError, tk.TclError):
+        pass # Ignore if window is closing
+    except Exception as e:
+        print(f"safe_update error: {e}")
 
 class RECT(Structure):
     _fields_ = [
@@ -199,39 +349,91 @@ class MONITORINFO(Structure):
         ('dwFlags',   wintypes.DWORD),
     ]
 
+# One-time argtype/restype declarations: argtype-less ctypes calls rebox
+# every argument on each call, which is measurably slower.
+if _user32 is not None:
+    _user32.MonitorFromPoint.argtypes = [wintypes.POINT, wintypes.DWORD]
+    _user32.MonitorFromPoint.restype = ctypes.c_void_p
+    _user32.GetMonitorInfoW.argtypes = [ctypes.c_void_p, ctypes.POINTER(MONITORINFO)]
+    _user32.GetMonitorInfoW.restype = wintypes.BOOL
+    if _shcore is not None:
+        _shcore.GetDpiForMonitor.argtypes = [
+            ctypes.c_void_p, ctypes.c_int,
+            ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint),
+        ]
+        _shcore.GetDpiForMonitor.restype = ctypes.c_int
+
+# Reusable ctypes buffers for the monitor query (UI thread only, so no lock
+# is needed); avoids re-allocating a MONITORINFO/POINT per query.
+_MI = MONITORINFO()
+_MI.cbSize = sizeof(MONITORINFO)
+_POINT0 = wintypes.POINT(0, 0)
+
+# On non-Windows the query has a fixed answer, so it is decided at import
+# time and the helpers never take the try/except path at all.
+_monitor_query_cache = None if _user32 is not None else (1.0, (0, 0, 0, 0), (0, 0, 0, 0))
+
+def _query_primary_monitor():
+    """
+    Queries the PRIMARY monitor once and caches the result as
+    (scale, work_rect, taskbar_offsets):
+      * scale            – DPI scale factor (1.0 on non-Windows / failure)
+      * work_rect        – (left, top, right, bottom) work area, physical px
+      * taskbar_offsets  – (top, bottom, left, right) app-bar thicknesses
+    A single MonitorFromPoint + GetMonitorInfoW + GetDpiForMonitor pass
+    replaces the three independent syscall chains the helpers used to make.
+    """
+    global _monitor_query_cache
+    if _monitor_query_cache is not None:
+        return _monitor_query_cache
+
+    scale = 1.0
+    work_rect = (0, 0, 0, 0)
+    offsets = (0, 0, 0, 0)
+    if _user32 is not None:
+        try:
+            # MONITOR_DEFAULTTOPRIMARY = 1
+            hMon = _user32.MonitorFromPoint(_POINT0, 1)
+            mi = _MI
+            _user32.GetMonitorInfoW(hMon, byref(mi))
+            work_rect = (mi.rcWork.left, mi.rcWork.top, mi.rcWork.right, mi.rcWork.bottom)
+            offsets = (
+                mi.rcWork.top - mi.rcMonitor.top,
+                mi.rcMonitor.bottom - mi.rcWork.bottom,
+                mi.rcWork.left - mi.rcMonitor.left,
+                mi.rcMonitor.right - mi.rcWork.right,
+            )
+            if _shcore is not None:
+                dpi_x = ctypes.c_uint()
+                dpi_y = ctypes.c_uint()
+                _shcore.GetDpiForMonitor(hMon, 0, byref(dpi_x), byref(dpi_y))  # MDT_EFFECTIVE_DPI = 0
+                scale = dpi_x.value / 96.0
+            else:
+                # Fallback to older method if shcore is unavailable
+                hdc = _user32.GetDC(0)
+                LOGPIXELSX = 88
+                dpi = ctypes.windll.gdi32.GetDeviceCaps(hdc, LOGPIXELSX)
+                _user32.ReleaseDC(0, hdc)
+                scale = dpi / 96.0
+        except Exception:
+            pass  # Keep safe defaults if any Win32 call fails
+
+    _monitor_query_cache = (scale, work_rect, offsets)
+    return _monitor_query_cache
+
 def get_taskbar_offsets():
     """
     Returns (top, bottom, left, right) thickness of any app‑bars (e.g., the Windows taskbar)
     by comparing the monitor rectangle to its work‑area rectangle.
     """
-    user32 = ctypes.windll.user32
-    # Get handle to primary monitor (MONITOR_DEFAULTTOPRIMARY = 1)
-    hMon = user32.MonitorFromPoint(wintypes.POINT(0, 0), 1)
-    mi = MONITORINFO()
-    mi.cbSize = sizeof(MONITORINFO)
-    user32.GetMonitorInfoW(hMon, byref(mi))
-    top_off    = mi.rcWork.top    - mi.rcMonitor.top
-    bottom_off = mi.rcMonitor.bottom - mi.rcWork.bottom
-    left_off   = mi.rcWork.left   - mi.rcMonitor.left
-    right_off  = mi.rcMonitor.right - mi.rcWork.right
-    return top_off, bottom_off, left_off, right_off
+    return _query_primary_monitor()[2]
 
 def get_work_area():
     """
     Returns (left, top, right, bottom) of the PRIMARY monitor's work area
     in **physical** pixels (i.e. screen minus taskbars).
     """
-    user32 = ctypes.windll.user32
-    hMon = user32.MonitorFromPoint(wintypes.POINT(0,0), 1)  # MONITOR_DEFAULTTOPRIMARY
-    mi = MONITORINFO()
-    mi.cbSize = sizeof(MONITORINFO)
-    user32.GetMonitorInfoW(hMon, byref(mi))
-    return (
-        mi.rcWork.left,
-        mi.rcWork.top,
-        mi.rcWork.right,
-        mi.rcWork.bottom,
-    )
+    return _query_primary_monitor()[1]
 
 # ──────────────────────────────────────────────────────────
 # Magic‑fudge divisor based on DPI scale
@@ -254,9 +456,16 @@ class ArchivePasswordCrackerApp(ctk.CTk):
     # Init / layout
     # ════════════════════════════════════════════════════════════════
     def __init__(self):
-        global app_instance
+        global app_instance, _app_ref
         super().__init__()
         app_instance = self
+        _app_ref = weakref.ref(self)
+        self._tk_thread_id = threading.get_ident()
+
+        # Keep the window unmapped while the ~20 CTk widgets are built so Tk
+        # lays everything out once at deiconify instead of repainting per
+        # widget; noticeably better time-to-first-paint.
+        self.withdraw()
 
         self.backend_ok = Path(CPP_EXECUTABLE_PATH).is_file()
 
@@ -286,6 +495,12 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         self.geometry(f"{w}x{h}+{x}+{y}")
         self.minsize(min_w, min_h)
 
+        # Overlap the JSON default reads with Tk widget construction below.
+        prefetch = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        for fname in _DEFAULT_JSON_FILES:
+            prefetch.submit(_get_json_list, fname)
+        prefetch.shutdown(wait=False)
+
         # Main frame
         self.main = ctk.CTkFrame(self)
         self.main.pack(padx=15, pady=15, fill="both", expand=True)
@@ -305,6 +520,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         ctk.CTkLabel(self.main, text="Charset:").grid(
             row=row_idx, column=1, padx=(0,10), pady=5, sticky="e"
         )
+        charset_map = _get_json_list("charset_map.json")
         default_charset = charset_map[0] if charset_map else "abcdefghijklmnopqrstuvwxyz0123456789"
         self.charset_var = tk.StringVar(value=default_charset)
         self.charset_entry = ctk.CTkEntry(
@@ -314,6 +530,10 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             row=row_idx, column=2, columnspan=2, padx=(0,10), pady=5, sticky="ew"
         )
         self._enable_undo_redo(self.charset_entry)
+        # Charset normalization is cached until the entry changes; the trace
+        # only invalidates (cheap) so nothing heavy runs per keystroke.
+        self._charset_cache = None
+        self.charset_var.trace("w", lambda *a: setattr(self, "_charset_cache", None))
         row_idx += 1
 
         # ──────────────────────────────────────────────────────────
@@ -321,6 +541,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         # ──────────────────────────────────────────────────────────
         self.minlen_label = ctk.CTkLabel(self.main, text="Min Length:")
         self.minlen_label.grid(row=row_idx, column=1, padx=(0, 10), pady=5, sticky="e")
+        min_length_map = _get_json_list("min_length_map.json")
         default_min_length = min_length_map[0] if min_length_map else "1"
         self.minlen_var = tk.StringVar(value=default_min_length)
         vcmd_int = (self.register(self._validate_positive_int), "%P")
@@ -343,6 +564,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         # ──────────────────────────────────────────────────────────
         self.maxlen_label = ctk.CTkLabel(self.main, text="Max Length:")
         self.maxlen_label.grid(row=row_idx, column=1, padx=(0, 10), pady=5, sticky="e")
+        max_length_map = _get_json_list("max_length_map.json")
         default_max_length = max_length_map[0] if max_length_map else "8"
         self.maxlen_var = tk.StringVar(value=default_max_length)
         self.maxlen_entry = ctk.CTkEntry(
@@ -378,6 +600,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         ctk.CTkLabel(self.main, text="Archive File:").grid(
             row=row_idx, column=1, padx=(0,10), pady=5, sticky="e"
         )
+        archive_file_map = _get_json_list("archive_file_map.json")
         default_archive_file = archive_file_map[0] if archive_file_map else ""
         self.archive_path_var = tk.StringVar(value=default_archive_file)
         self.archive_entry = ctk.CTkEntry( self.main, textvariable=self.archive_path_var )
@@ -415,8 +638,6 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         self._enable_undo_redo(self.pattern_entry)
         row_idx += 1
 
-        self._entry_bg_normal = self.minlen_entry.cget("fg_color")
-        self._entry_fg_normal = self.minlen_entry.cget("text_color")
         self._minlen_label_normal = self.minlen_label.cget("text_color")
         self._maxlen_label_normal = self.maxlen_label.cget("text_color")
         self._pattern_label_normal = self.pattern_label.cget("text_color")
@@ -426,24 +647,27 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         self._entry_fg_disabled = "#777777"  # Gray text for disabled state
         self._label_fg_disabled = "#777777"  # Gray text for disabled labels
 
-        self.pattern_entry.configure(
-            state="disabled",
-            fg_color=self._entry_bg_disabled,
-            text_color=self._entry_fg_disabled
-        )
-        self.pattern_label.configure(text_color=self._label_fg_disabled)        
+        # Last applied enabled-state per entry; lets _apply_entry_state skip
+        # the (expensive) .configure round-trips when nothing changed.
+        self._entry_state_cache = {}
+        self._label_normal_colors = {
+            "minlen": self._minlen_label_normal,
+            "maxlen": self._maxlen_label_normal,
+            "pattern": self._pattern_label_normal,
+        }
+        self._apply_entry_state("pattern", self.pattern_entry, self.pattern_label, False)
 
         # --- NEW: Skip List Controls ---
         # ──────────────────────────────────────────────────────────
         # Skip List Checkbox & Clear Button
         # ──────────────────────────────────────────────────────────
         self.skip_var = tk.BooleanVar(value=True) # Default to ON
-        skip_cb = ctk.CTkCheckBox(
+        self.skip_checkbox = ctk.CTkCheckBox(
             self.main,
             text="Exclude previously tried passwords (uses helpers/" + SKIP_LIST_FILENAME + ")",
             variable=self.skip_var
         )
-        skip_cb.grid(row=row_idx, column=1, columnspan=2, padx=(0,10), pady=(10,5), sticky="w")
+        self.skip_checkbox.grid(row=row_idx, column=1, columnspan=2, padx=(0,10), pady=(10,5), sticky="w")
 
         self.clear_skip_btn = ctk.CTkButton(
              self.main, text="Clear Skip List", width=90, command=self.clear_skip_list
@@ -452,6 +676,19 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         row_idx += 1
         # --- END NEW ---
 
+        # ──────────────────────────────────────────────────────────
+        # Advanced: target false-positive rate for the skip list
+        # ──────────────────────────────────────────────────────────
+        # A false positive means skipping a password that was never actually
+        # tried, so the backend sizes a NEW filter (m and k) from this rate.
+        self.fpr_label = ctk.CTkLabel(self.main, text="Skip List FPR (advanced):")
+        self.fpr_label.grid(row=row_idx, column=1, padx=(0, 10), pady=5, sticky="e")
+        self.fpr_var = tk.StringVar(value="0.01")
+        self.fpr_entry = ctk.CTkEntry(self.main, textvariable=self.fpr_var, width=80)
+        self.fpr_entry.grid(row=row_idx, column=2, padx=0, pady=5, sticky="w")
+        self._enable_undo_redo(self.fpr_entry)
+        row_idx += 1
+
 
         # ──────────────────────────────────────────────────────────
         # Run / Stop buttons
@@ -490,8 +727,17 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         self.status_txt.grid(
             row=row_idx, column=1, columnspan=3, padx=(0,10), pady=(0,10), sticky="nsew"
         )
+        # Severity tags are configured once; _flush_log applies them as line
+        # spans after its single batched insert instead of styling per line.
+        self.status_txt.tag_config('err', foreground='red')
+        self.status_txt.tag_config('ok', foreground='green')
         self.main.grid_rowconfigure(row_idx, weight=1) # Configure *this* row to expand vertically
 
+        # The window geometry is fixed above; stop the frame re-deriving its
+        # size from every gridded child and show the finished window.
+        self.main.grid_propagate(False)
+        self.deiconify()
+
         # ──────────────────────────────────────────────────────────
         # Runtime state
         # ──────────────────────────────────────────────────────────
@@ -499,16 +745,60 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         self.stdout_thread = None
         self.stderr_thread = None
         self.running = False
-        self.log_messages = []  # List to store log messages
+        # Bounded log history: a plain list grows without limit over a long
+        # cracking run and appending to the Text widget becomes O(N).
+        self.log_messages = collections.deque(maxlen=200000)
+        # Lines waiting for the coalesced textbox insert (50 ms window).
+        self._pending_log = []
+        self._log_flush_id = None
+        self._last_status_trim = 0.0
+        # Consecutive-duplicate suppression state
+        self._last_log_line = None
+        self._last_log_time = 0.0
+        self._dup_count = 0
+        # Append-mode log handle (opened on first save) plus counters so
+        # each save only writes the entries added since the previous one.
+        self._log_fp = None
+        self._log_written_count = 0
+        self._log_appended_total = 0
+        # Backend output lands here from the reader threads and is drained
+        # in batches by a 50 ms tick instead of one Tk callback per line.
+        self._line_queue = queue.Queue()
+        self._line_drain_id = None
         self.found_password = None
         self.stopped_by_user = False
-        self.monitor_after_id = None
-
-        self.pattern_var.trace("w", self.update_length_fields)
-        self.pattern_matching_var.trace("w", self.update_length_fields)
-        self.minlen_var.trace("w", self.validate_min_length)
-        self.minlen_var.trace("w", self.validate_max_length)
-        self.maxlen_var.trace("w", self.validate_max_length)
+        self._stop_thread = None
+        # Built once; the stop path never changes during a session
+        self._stop_flag_path = SKIP_LIST_PATH + ".stop"
+        # Launch parameters are identical for every run; build them once
+        self._process_cwd = Path(CPP_EXECUTABLE_PATH).parent
+        self._win_creationflags = 0
+        self._win_startupinfo = None
+        if IS_WINDOWS:
+            # Hide console window for C++ process
+            self._win_creationflags = subprocess.CREATE_NO_WINDOW
+            si = subprocess.STARTUPINFO()
+            si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            si.wShowWindow = subprocess.SW_HIDE
+            self._win_startupinfo = si
+        # Per-instance LRU over archive path resolution (stat-heavy on slow
+        # or network paths); cleared whenever browse/drop picks a new file.
+        self._resolved_path_cache = functools.lru_cache(maxsize=8)(self._resolve_archive)
+
+        # Single-entry (pattern -> props) cache shared by the trace callbacks,
+        # so update_length_fields and validate_min_length analyse the same
+        # pattern string once between changes.
+        self._pattern_cache = ("", _pattern_props(""))
+
+        # Debounced traces: rapid keystrokes collapse into one validation pass
+        # instead of reparsing the pattern and reconfiguring widgets per key.
+        self._debounce_ids = {}
+        self.pattern_var.trace("w", lambda *a: self._schedule_debounced("length_fields", self.update_length_fields))
+        self.pattern_matching_var.trace("w", lambda *a: self._schedule_debounced("length_fields", self.update_length_fields))
+        # Single trace on minlen_var runs both validations (previously two
+        # separate Tcl-level trace entries ran serially per keystroke).
+        self.minlen_var.trace("w", lambda *a: self._schedule_debounced("min_length", self._validate_lengths))
+        self.maxlen_var.trace("w", lambda *a: self._schedule_debounced("max_length", self.validate_max_length))
 
 
 
@@ -519,68 +809,83 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             self.update_status(f"[ERROR] {err_msg}")
             self.after(100, lambda: messagebox.showerror("Setup Error", popup_msg))
 
-    def update_length_fields(self, *args):
-        """Update min/max length fields, pattern entry, and their labels based on pattern matching state."""
-        if not self.pattern_matching_var.get():
-            # Pattern matching disabled: enable min/max, disable pattern
-            self.minlen_entry.configure(
-                state="normal",
-                fg_color=self._entry_bg_normal,
-                text_color=self._entry_fg_normal
-            )
-            self.maxlen_entry.configure(
+    def _schedule_debounced(self, key, fn, delay_ms=80, *args):
+        """Coalesce rapid trace callbacks: (re)schedule *fn*(*args*) per *key*.
+
+        Arguments ride along through Tk's after instead of being captured in
+        a fresh closure/partial per event.
+        """
+        pending = self._debounce_ids.get(key)
+        if pending is not None:
+            try:
+                self.after_cancel(pending)
+            except (RuntimeError, tk.TclError):
+                pass
+        self._debounce_ids[key] = self.after(delay_ms, self._run_debounced, key, fn, *args)
+
+    def _run_debounced(self, key, fn, *args):
+        self._debounce_ids.pop(key, None)
+        fn(*args)
+
+    def _cached_pattern_props(self, pattern):
+        """Return (segments, min_len, contains_star), recomputing only when
+        the pattern string actually changed since the last callback."""
+        key, props = self._pattern_cache
+        if key != pattern:
+            props = _pattern_props(pattern)
+            self._pattern_cache = (pattern, props)
+        return props
+
+    def _validate_lengths(self, *args):
+        """Run both length validations from a single minlen_var trace."""
+        self.validate_min_length()
+        self.validate_max_length()
+
+    def _apply_entry_state(self, key, entry, label, enabled):
+        """Enable/disable an entry + its label, skipping redundant .configure calls.
+
+        Each .configure on a CTk widget walks Tcl and repaints, so only touch
+        the widgets when the cached state for *key* actually changes.
+        """
+        if self._entry_state_cache.get(key) == enabled:
+            return
+        self._entry_state_cache[key] = enabled
+        if enabled:
+            entry.configure(
                 state="normal",
                 fg_color=self._entry_bg_normal,
                 text_color=self._entry_fg_normal
             )
-            self.minlen_label.configure(text_color=self._minlen_label_normal)
-            self.maxlen_label.configure(text_color=self._maxlen_label_normal)
-            self.pattern_entry.configure(
+            label.configure(text_color=self._label_normal_colors[key])
+        else:
+            entry.configure(
                 state="disabled",
                 fg_color=self._entry_bg_disabled,
                 text_color=self._entry_fg_disabled
             )
-            self.pattern_label.configure(text_color=self._label_fg_disabled)
+            label.configure(text_color=self._label_fg_disabled)
+
+    def update_length_fields(self, *args):
+        """Update min/max length fields, pattern entry, and their labels based on pattern matching state."""
+        if not self.pattern_matching_var.get():
+            # Pattern matching disabled: enable min/max, disable pattern
+            self._apply_entry_state("minlen", self.minlen_entry, self.minlen_label, True)
+            self._apply_entry_state("maxlen", self.maxlen_entry, self.maxlen_label, True)
+            self._apply_entry_state("pattern", self.pattern_entry, self.pattern_label, False)
         else:
             # Pattern matching enabled: enable pattern
-            self.pattern_entry.configure(
-                state="normal",
-                fg_color=self._entry_bg_normal,
-                text_color=self._entry_fg_normal
-            )
-            self.pattern_label.configure(text_color=self._pattern_label_normal)
+            self._apply_entry_state("pattern", self.pattern_entry, self.pattern_label, True)
             pattern = self.pattern_var.get().strip()
             if not pattern:
                 # Empty pattern: enable min/max
-                self.minlen_entry.configure(
-                    state="normal",
-                    fg_color=self._entry_bg_normal,
-                    text_color=self._entry_fg_normal
-                )
-                self.maxlen_entry.configure(
-                    state="normal",
-                    fg_color=self._entry_bg_normal,
-                    text_color=self._entry_fg_normal
-                )
-                self.minlen_label.configure(text_color=self._minlen_label_normal)
-                self.maxlen_label.configure(text_color=self._maxlen_label_normal)
+                self._apply_entry_state("minlen", self.minlen_entry, self.minlen_label, True)
+                self._apply_entry_state("maxlen", self.maxlen_entry, self.maxlen_label, True)
                 return
-            segments = parse_pattern(pattern)
-            default_min, contains_star = calculate_pattern_properties(segments)
+            segments, default_min, contains_star = self._cached_pattern_props(pattern)
             if contains_star:
                 # Pattern has '*': enable min/max
-                self.minlen_entry.configure(
-                    state="normal",
-                    fg_color=self._entry_bg_normal,
-                    text_color=self._entry_fg_normal
-                )
-                self.maxlen_entry.configure(
-                    state="normal",
-                    fg_color=self._entry_bg_normal,
-                    text_color=self._entry_fg_normal
-                )
-                self.minlen_label.configure(text_color=self._minlen_label_normal)
-                self.maxlen_label.configure(text_color=self._maxlen_label_normal)
+                self._apply_entry_state("minlen", self.minlen_entry, self.minlen_label, True)
+                self._apply_entry_state("maxlen", self.maxlen_entry, self.maxlen_label, True)
                 try:
                     # Only check/set if the field is NOT empty
                     current_val_str = self.minlen_var.get()
@@ -601,18 +906,8 @@ class ArchivePasswordCrackerApp(ctk.CTk):
                 # Pattern has no '*': disable min/max
                 self.minlen_var.set(str(default_min))
                 self.maxlen_var.set(str(default_min))
-                self.minlen_entry.configure(
-                    state="disabled",
-                    fg_color=self._entry_bg_disabled,
-                    text_color=self._entry_fg_disabled
-                )
-                self.maxlen_entry.configure(
-                    state="disabled",
-                    fg_color=self._entry_bg_disabled,
-                    text_color=self._entry_fg_disabled
-                )
-                self.minlen_label.configure(text_color=self._label_fg_disabled)
-                self.maxlen_label.configure(text_color=self._label_fg_disabled)
+                self._apply_entry_state("minlen", self.minlen_entry, self.minlen_label, False)
+                self._apply_entry_state("maxlen", self.maxlen_entry, self.maxlen_label, False)
 
     def validate_min_length(self, *args):
         """Ensure min length is >= default_min when pattern matching is enabled with '*'."""
@@ -623,8 +918,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         if not pattern:
             return # No pattern, no pattern-specific validation needed
 
-        segments = parse_pattern(pattern)
-        default_min, contains_star = calculate_pattern_properties(segments)
+        segments, default_min, contains_star = self._cached_pattern_props(pattern)
 
         if contains_star: # Only enforce if pattern has '*' (otherwise lengths are fixed by pattern)
             current_val_str = self.minlen_var.get()
@@ -686,44 +980,96 @@ class ArchivePasswordCrackerApp(ctk.CTk):
 
 
     # ════════════════════════════════════════════════════════════════
-    # Utility – undo / redo support (No changes needed)
+    # Utility – undo / redo support
     # ════════════════════════════════════════════════════════════════
     def _enable_undo_redo(self, ctk_entry: ctk.CTkEntry):
+        """Register an entry for Ctrl+Z / Ctrl+Y / Ctrl+Shift+Z undo-redo.
+
+        The key bindings are installed once at class level (bind_class on
+        the internal Entry's widget class) and dispatch to shared handlers,
+        so each registered entry costs one WeakKeyDictionary slot instead
+        of four bind-table entries and three closures of its own. Widgets
+        that were never registered have no stack and the handlers no-op.
+
+        History is stored as (position, removed_text, inserted_text) diffs
+        in a bounded deque rather than full-value snapshots, so memory is
+        O(edits x diff size) with a hard cap instead of O(value length) per
+        keystroke. Keystrokes within a 200 ms window coalesce into one diff.
+        """
         internal = getattr(ctk_entry, "_entry", None) or getattr(ctk_entry, "entry", ctk_entry)
+        if not hasattr(self, "_undo_stacks"):
+            # Per-widget state: [undo_deque, redo_list, last_committed_value].
+            # WeakKey so destroyed widgets drop their history automatically.
+            self._undo_stacks = weakref.WeakKeyDictionary()
+            cls = internal.winfo_class()
+            internal.bind_class(cls, "<KeyRelease>", self._undo_record, add="+")
+            internal.bind_class(cls, "<Control-z>", self._undo_handler)
+            internal.bind_class(cls, "<Control-y>", self._redo_handler)
+            internal.bind_class(cls, "<Control-Shift-Z>", self._redo_handler)
+        self._undo_stacks[internal] = [collections.deque(maxlen=500), [], internal.get()]
+
+    @staticmethod
+    def _entry_diff(old, new):
+        """Minimal (pos, removed, inserted) edit between two strings, or
+        None when they are equal. Computed from the common prefix/suffix."""
+        if old == new:
+            return None
+        limit = min(len(old), len(new))
+        p = 0
+        while p < limit and old[p] == new[p]:
+            p += 1
+        s = 0
+        while s < limit - p and old[len(old) - 1 - s] == new[len(new) - 1 - s]:
+            s += 1
+        return (p, old[p:len(old) - s], new[p:len(new) - s])
+
+    def _undo_record(self, event):
+        if event.widget in self._undo_stacks:
+            # Coalesce typing bursts: commit one diff per 200 ms of quiet
+            self._schedule_debounced(event.widget, self._undo_commit, 200, event.widget)
+
+    def _undo_commit(self, widget):
+        state = self._undo_stacks.get(widget)
+        if state is None:
+            return
         try:
-            internal.configure(undo=True, autoseparators=True, maxundo=-1)
-            internal.bind("<Control-z>", lambda e: internal.edit_undo())
-            internal.bind("<Control-y>", lambda e: internal.edit_redo())
-            internal.bind("<Control-Shift-Z>", lambda e: internal.edit_redo())
-        except tk.TclError:  # Entry widget without built‑in undo
-            internal._undo_stack = [internal.get()]
-            internal._undo_index = 0
-
-            def record(event=None):
-                val = internal.get()
-                if val != internal._undo_stack[internal._undo_index]:
-                    internal._undo_stack = internal._undo_stack[:internal._undo_index+1]
-                    internal._undo_stack.append(val)
-                    internal._undo_index += 1
-
-            def undo(event=None):
-                if internal._undo_index > 0:
-                    internal._undo_index -= 1
-                    internal.delete(0, tk.END)
-                    internal.insert(0, internal._undo_stack[internal._undo_index])
-                return "break"
-
-            def redo(event=None):
-                if internal._undo_index < len(internal._undo_stack) - 1:
-                    internal._undo_index += 1
-                    internal.delete(0, tk.END)
-                    internal.insert(0, internal._undo_stack[internal._undo_index])
-                return "break"
-
-            internal.bind("<KeyRelease>", record)
-            internal.bind("<Control-z>", undo)
-            internal.bind("<Control-y>", redo)
-            internal.bind("<Control-Shift-Z>", redo)
+            new = widget.get()
+        except tk.TclError:
+            return
+        diff = self._entry_diff(state[2], new)
+        if diff is not None:
+            state[0].append(diff)
+            state[1].clear()  # Editing after an undo discards the redo tail
+            state[2] = new
+
+    def _undo_apply(self, widget, state, value):
+        widget.delete(0, tk.END)
+        widget.insert(0, value)
+        state[2] = value
+
+    def _undo_handler(self, event):
+        state = self._undo_stacks.get(event.widget)
+        if state is None:
+            return None
+        self._undo_commit(event.widget)  # Fold any pending burst first
+        undo, redo, cur = state
+        if undo:
+            pos, removed, inserted = undo.pop()
+            self._undo_apply(event.widget, state, cur[:pos] + removed + cur[pos + len(inserted):])
+            redo.append((pos, removed, inserted))
+        return "break"
+
+    def _redo_handler(self, event):
+        state = self._undo_stacks.get(event.widget)
+        if state is None:
+            return None
+        self._undo_commit(event.widget)
+        undo, redo, cur = state
+        if redo:
+            pos, removed, inserted = redo.pop()
+            self._undo_apply(event.widget, state, cur[:pos] + inserted + cur[pos + len(removed):])
+            undo.append((pos, removed, inserted))
+        return "break"
 
     # ════════════════════════════════════════════════════════════════
     # Drag‑and‑drop handler (No changes needed)
@@ -734,6 +1080,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             # Decode bytes to UTF-8 string
             path = files[0].decode("utf-8", errors='ignore')
             if os.path.isfile(path):
+                self._resolved_path_cache.cache_clear() # Filesystem may have changed
                 self.archive_path_var.set(path)
                 self.update_status(f"Archive dropped: {os.path.basename(path)}")
             else:
@@ -744,20 +1091,89 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             safe_update(messagebox.showerror, "Drop Error", f"Could not process dropped item:\n{e}")
 
     # ════════════════════════════════════════════════════════════════
-    # Status textbox utility (No changes needed)
+    # Status textbox utility
     # ════════════════════════════════════════════════════════════════
     def update_status(self, msg: str):
         if not self or not hasattr(self, 'status_txt') or not self.status_txt.winfo_exists():
             print(f"DBG Status Update (No GUI): {msg}")
             return
+        try:
+            # One timestamp per call, shared by every line in the burst;
+            # time.strftime on a struct_time is much lighter than building a
+            # datetime object and strftime'ing %f just to truncate it.
+            now = time.time()
+            ts = time.strftime("%H:%M:%S", time.localtime(now)) + f".{int(now % 1 * 1000):03d}"
+            urgent = False
+            for line in str(msg).strip().splitlines():
+                line = line.strip()
+                # Collapse runs of identical lines (repetitive backend
+                # progress noise) into one line plus a repeat count.
+                if line == self._last_log_line and now - self._last_log_time < 1.0:
+                    self._dup_count += 1
+                    continue
+                self._last_log_line = line
+                self._last_log_time = now
+                if self._dup_count:
+                    self._pending_log.append(f"[{ts}] (last message repeated {self._dup_count} times)")
+                    self._dup_count = 0
+                self._pending_log.append(f"[{ts}] {line}")
+                if line.startswith("[ERROR]"):
+                    urgent = True
+            if urgent:
+                # Error lines hit the widget immediately rather than waiting
+                # out the coalescing window.
+                self._flush_log()
+            elif self._pending_log and self._log_flush_id is None:
+                self._log_flush_id = self.after(50, self._flush_log)
+        except (RuntimeError, tk.TclError):
+            pass
+        except Exception as e:
+            print(f"Error updating status log: {e}")
+
+    def _flush_log(self):
+        """Insert all pending log lines into the textbox in one Tcl call.
+
+        Each insert is a round-trip through the Tcl interpreter, so bursts
+        of backend output are coalesced for up to 50 ms and written as a
+        single string.
+        """
+        if self._log_flush_id is not None:
+            try:
+                self.after_cancel(self._log_flush_id)
+            except (RuntimeError, tk.TclError):
+                pass
+            self._log_flush_id = None
+        if self._dup_count:
+            # A run of duplicates is still open; summarize it so the flush
+            # reflects everything received so far.
+            now = time.time()
+            ts = time.strftime("%H:%M:%S", time.localtime(now)) + f".{int(now % 1 * 1000):03d}"
+            self._pending_log.append(f"[{ts}] (last message repeated {self._dup_count} times)")
+            self._dup_count = 0
+        if not self._pending_log:
+            return
+        pending, self._pending_log = self._pending_log, []
+        self.log_messages.extend(pending)
+        self._log_appended_total += len(pending)
         try:
             self.status_txt.configure(state="normal")
-            ts = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            lines = str(msg).strip().splitlines()
-            for line in lines:
-                log_entry = f"[{ts}] {line.strip()}"
-                self.status_txt.insert(tk.END, log_entry + "\n")
-                self.log_messages.append(log_entry)  # Store the log entry
+            start_line = int(self.status_txt.index('end-1c').split('.')[0])
+            self.status_txt.insert(tk.END, "\n".join(pending) + "\n")
+            # Tag error/success lines; the common progress line needs no call
+            for i, line in enumerate(pending):
+                if "[ERROR]" in line:
+                    self.status_txt.tag_add('err', f"{start_line + i}.0", f"{start_line + i}.end")
+                elif "SUCCESS" in line:
+                    self.status_txt.tag_add('ok', f"{start_line + i}.0", f"{start_line + i}.end")
+            # Tk Text slows down as content grows; keep the visible widget to
+            # the most recent 5000 lines (full history stays in log_messages
+            # and log.txt), trimming at most once per second.
+            now = time.monotonic()
+            if now - self._last_status_trim > 1.0:
+                self._last_status_trim = now
+                total_lines = int(self.status_txt.index('end-1c').split('.')[0])
+                if total_lines > 5000:
+                    self.status_txt.delete('1.0', f'{total_lines - 5000}.0')
             self.status_txt.see(tk.END)
             self.status_txt.configure(state="disabled")
         except (RuntimeError, tk.TclError):
@@ -766,11 +1182,24 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             print(f"Error updating status log: {e}")
 
     def save_log_to_file(self):
+        if self._pending_log:
+            self._flush_log()  # Make sure coalesced lines are in log_messages
         log_file_path = resource_path(os.path.join("helpers", "log.txt"))  # Save in the same directory as the script
         try:
-            with open(log_file_path, 'w', encoding='utf-8') as f:
-                for log_entry in self.log_messages:
-                    f.write(log_entry + "\n")
+            # Append only the entries added since the last save; rewriting
+            # (and re-encoding) the whole history on every backend exit is
+            # O(total lines) for no benefit.
+            if self._log_fp is None:
+                self._log_fp = open(log_file_path, 'a', encoding='utf-8', buffering=1 << 20)
+            unwritten = self._log_appended_total - self._log_written_count
+            if unwritten > 0:
+                # The deque may have dropped old entries past its maxlen, so
+                # take the newest `unwritten` entries from the right.
+                start = max(0, len(self.log_messages) - unwritten)
+                self._log_fp.write("\n".join(itertools.islice(self.log_messages, start, None)))
+                self._log_fp.write("\n")
+                self._log_fp.flush()
+                self._log_written_count = self._log_appended_total
             self.update_status(f"Log saved to {log_file_path}")
         except Exception as e:
             self.update_status(f"Error saving log to file: {e}")
@@ -781,7 +1210,33 @@ class ArchivePasswordCrackerApp(ctk.CTk):
     # ════════════════════════════════════════════════════════════════
     def _validate_positive_int(self, P):
         # Allow empty string (for clearing field) or positive integers
-        return (P.isdigit() and int(P) > 0) or P == ""
+        return _posint_match(P) is not None
+
+    def _normalized_charset(self, charset):
+        """Return the charset with duplicate characters dropped (first
+        occurrence wins). Duplicates silently inflate the backend's search
+        space. Dedup runs on C-level byte ops and is cached until the
+        charset entry changes."""
+        cached = self._charset_cache
+        if cached is not None and cached[0] == charset:
+            return cached[1]
+        try:
+            # dict.fromkeys over the raw bytes dedupes in C while keeping order
+            normalized = bytes(dict.fromkeys(charset.encode("latin1"))).decode("latin1")
+        except UnicodeEncodeError:
+            # Charset contains non-latin1 characters; dedupe on code points
+            normalized = "".join(dict.fromkeys(charset))
+        self._charset_cache = (charset, normalized)
+        return normalized
+
+    def _resolve_archive(self, path_str):
+        """Expand and resolve the archive path, raising if it is not an
+        existing file. Wrapped in an LRU in __init__ so repeated runs with
+        the same entry text skip the stat() syscalls entirely."""
+        p = Path(path_str).expanduser()
+        if not p.is_file():
+            raise FileNotFoundError("Specified path is not a file or does not exist.")
+        return str(p.resolve())
 
     def browse_archive(self):
         ft = [("Archive Files", "*.zip *.rar *.7z *.tar *.gz *.bz2"), ("All Files", "*.*")]
@@ -789,18 +1244,43 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         initial_dir = os.path.dirname(self.archive_path_var.get()) if self.archive_path_var.get() else "."
         p = filedialog.askopenfilename(title="Select Encrypted Archive File", filetypes=ft, initialdir=initial_dir)
         if p:
+            self._resolved_path_cache.cache_clear() # Filesystem may have changed
             self.archive_path_var.set(p)
 
     # --- NEW: Clear Skip List Function ---
     def clear_skip_list(self):
         global SKIP_LIST_PATH
         if os.path.isfile(SKIP_LIST_PATH):
+            # Sanity read: report filter parameters before offering to delete.
+            # Gated on the magic bytes — a file written by a backend build
+            # that predates the blocked format is still a perfectly valid
+            # thing to clear, not something to warn about on every click.
+            try:
+                with open(SKIP_LIST_PATH, "rb") as f:
+                    is_blocked = f.read(len(_BBF_MAGIC)) == _BBF_MAGIC
+                if is_blocked:
+                    with BlockedBloom(SKIP_LIST_PATH) as bf:
+                        self.update_status(
+                            f"Skip list: k={bf.num_hashes}, {bf.num_blocks} blocks "
+                            f"({bf.size_bytes() // 1024} KiB)."
+                        )
+                else:
+                    self.update_status("Skip list: legacy (pre-blocked) format; parameters unavailable.")
+            except (OSError, ValueError) as e:
+                self.update_status(f"[WARN] Skip list file unreadable as blocked filter: {e}")
             try:
                 if messagebox.askyesno("Confirm Clear",
                                        f"This will delete the file:\n{SKIP_LIST_PATH}\n\n"
                                        "Previously tried passwords for the next run will NOT be skipped.\n"
                                        "Are you sure?", icon='warning'):
-                    os.remove(SKIP_LIST_PATH)
+                    # Atomic rename is a pure metadata operation, so the UI
+                    # thread never waits on the (possibly large) file; the
+                    # actual unlink happens on a background thread.
+                    old_path = SKIP_LIST_PATH + ".old"
+                    os.replace(SKIP_LIST_PATH, old_path)
+                    threading.Thread(
+                        target=self._unlink_quiet, args=(old_path,), daemon=True
+                    ).start()
                     self.update_status(f"Skip list file '{SKIP_LIST_FILENAME}' removed.")
                     messagebox.showinfo("Cleared", f"Skip list file '{SKIP_LIST_FILENAME}' removed successfully.")
             except OSError as e:
@@ -809,6 +1289,14 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         else:
             self.update_status(f"Skip list file '{SKIP_LIST_FILENAME}' does not exist.")
             messagebox.showinfo("Not Found", f"Skip list file '{SKIP_LIST_FILENAME}' does not exist.")
+
+    @staticmethod
+    def _unlink_quiet(path):
+        """Best-effort unlink off the UI thread (used by clear_skip_list)."""
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"[WARN] Could not remove {path}: {e}")
     # --- END NEW ---
 
 
@@ -822,33 +1310,15 @@ class ArchivePasswordCrackerApp(ctk.CTk):
                 self.update_length_fields()
             else:
                 # Disable all entries and gray out labels
-                self.minlen_entry.configure(
-                    state="disabled",
-                    fg_color=self._entry_bg_disabled,
-                    text_color=self._entry_fg_disabled
-                )
-                self.maxlen_entry.configure(
-                    state="disabled",
-                    fg_color=self._entry_bg_disabled,
-                    text_color=self._entry_fg_disabled
-                )
-                self.pattern_entry.configure(
-                    state="disabled",
-                    fg_color=self._entry_bg_disabled,
-                    text_color=self._entry_fg_disabled
-                )
-                self.minlen_label.configure(text_color=self._label_fg_disabled)
-                self.maxlen_label.configure(text_color=self._label_fg_disabled)
-                self.pattern_label.configure(text_color=self._label_fg_disabled)
+                self._apply_entry_state("minlen", self.minlen_entry, self.minlen_label, False)
+                self._apply_entry_state("maxlen", self.maxlen_entry, self.maxlen_label, False)
+                self._apply_entry_state("pattern", self.pattern_entry, self.pattern_label, False)
             self.order_combo.configure(state=state)
             self.archive_entry.configure(state=state)
             self.browse_btn.configure(state=state)
-            # Find the checkbox widget for skip list
-            for widget in self.main.winfo_children():
-                if isinstance(widget, ctk.CTkCheckBox) and "Exclude" in widget.cget("text"):
-                    widget.configure(state=state)
-                    break
+            self.skip_checkbox.configure(state=state)
             self.clear_skip_btn.configure(state=state)
+            self.fpr_entry.configure(state=state)
             self.run_btn.configure(state="normal" if enabled and self.backend_ok else "disabled")
             self.stop_btn.configure(state="disabled" if enabled else "normal")
         except (RuntimeError, tk.TclError):
@@ -871,6 +1341,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         use_skip_list = self.skip_var.get() # <-- Get skip list state
 
         if not charset: safe_update(messagebox.showerror, "Input Error", "Charset cannot be empty."); return
+        dedup_charset = self._normalized_charset(charset)
         try:
             min_len = int(minlen_str)
             max_len = int(maxlen_str)
@@ -880,9 +1351,7 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         except ValueError as e: safe_update(messagebox.showerror, "Input Error", f"Invalid Length: {e}. Please enter positive numbers."); return
 
         try:
-            arc_path_obj = Path(arc_path_str).expanduser()
-            if not arc_path_obj.is_file(): raise FileNotFoundError("Specified path is not a file or does not exist.")
-            arc_path_abs = str(arc_path_obj.resolve()) # Use absolute path for C++
+            arc_path_abs = self._resolved_path_cache(arc_path_str) # Use absolute path for C++
         except Exception as e: safe_update(messagebox.showerror, "Input Error", f"Invalid Archive File Path:\n'{arc_path_str}'\n{e}"); return
 
         mode_arg = self.order_map.get(order_selection, "ascending") # Default to ascending if somehow invalid
@@ -893,12 +1362,11 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         try:
             self.status_txt.configure(state="normal"); self.status_txt.delete("1.0", tk.END); self.status_txt.configure(state="disabled")
         except Exception as e: print(f"Error clearing status text: {e}")
-        if self.monitor_after_id:
-            try: self.after_cancel(self.monitor_after_id);
-            except Exception: pass
-            self.monitor_after_id = None
 
         self.update_status(f"Launching backend: {Path(CPP_EXECUTABLE_PATH).name}...")
+        if dedup_charset != charset:
+            self.update_status(f"[WARN] Removed duplicate charset characters ({len(charset)} -> {len(dedup_charset)}).")
+            charset = dedup_charset
 
         # --- Construct Command (with optional skip list args) ---
         cmd = [
@@ -917,7 +1385,23 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             # --- END CHANGE ---
             cmd.extend(["--skip-file", SKIP_LIST_PATH])
             cmd.extend(["--checkpoint-interval", checkpoint_interval_sec])
-            self.update_status(f"Skip list enabled: {SKIP_LIST_FILENAME} (Checkpoint: {checkpoint_interval_sec}s)")
+            # Target FPR is only used when the backend creates a NEW filter;
+            # an existing .bf keeps the parameters stored in its header.
+            # Only passed (and advertised) when the binary knows the flag —
+            # an older build would just WARN and ignore it.
+            if backend_supports_flag(CPP_EXECUTABLE_PATH, b"--fp-rate"):
+                try:
+                    fp_rate = float(self.fpr_var.get().strip() or "0.01")
+                    if not 0.0 < fp_rate < 1.0:
+                        raise ValueError("FPR must be between 0 and 1 (exclusive)")
+                except ValueError:
+                    fp_rate = 0.01
+                    self.update_status("[WARN] Invalid skip list FPR, using default 0.01.")
+                cmd.extend(["--fp-rate", str(fp_rate)])
+                self.update_status(f"Skip list enabled: {SKIP_LIST_FILENAME} (Checkpoint: {checkpoint_interval_sec}s, Target FPR: {fp_rate})")
+            else:
+                self.update_status(f"Skip list enabled: {SKIP_LIST_FILENAME} (Checkpoint: {checkpoint_interval_sec}s)")
+                self.update_status("[WARN] Backend build predates --fp-rate; rebuild it (compile_cli.bat) to honor the Target FPR entry.")
         # --- END NEW ---
 
 
@@ -931,22 +1415,17 @@ class ArchivePasswordCrackerApp(ctk.CTk):
         self.update_status(f"Params: Charset='{charset}', Len={min_len}-{max_len}, Mode={mode_arg}")
         # self.update_status(f"Full Command (DEBUG): {' '.join(cmd)}") # Uncomment for debugging command
 
-        # --- Launch Process ---
-        creationflags = 0; startupinfo = None; process_cwd = Path(CPP_EXECUTABLE_PATH).parent
-        if platform.system() == "Windows":
-            # Hide console window for C++ process
-            creationflags=subprocess.CREATE_NO_WINDOW
-            startupinfo=subprocess.STARTUPINFO()
-            startupinfo.dwFlags|=subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow=subprocess.SW_HIDE
+        # --- Launch Process (parameters prebuilt in __init__) ---
         try:
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                text=True, encoding="utf-8", errors="replace", # Ensure UTF-8 decoding
-                bufsize=1, # Line buffered
-                creationflags=creationflags, startupinfo=startupinfo,
-                cwd=process_cwd # Set CWD to 'helpers' so C++ can find '../bin/7z.exe'
+                # Binary pipes: the reader threads chunk-read the raw fds and
+                # batch-decode, so a text-mode wrapper with line discipline
+                # would only add per-line decode overhead.
+                bufsize=65536,
+                creationflags=self._win_creationflags, startupinfo=self._win_startupinfo,
+                cwd=self._process_cwd # Set CWD to 'helpers' so C++ can find '../bin/7z.exe'
             )
         except FileNotFoundError:
              err = f"Launch Error: C++ Executable not found at\n{CPP_EXECUTABLE_PATH}"; self.update_status(f"[ERROR] {err}"); safe_update(messagebox.showerror, "Launch Error", err); self.running = False; self.set_ui_state(True); return
@@ -957,22 +1436,66 @@ class ArchivePasswordCrackerApp(ctk.CTk):
 
         self.update_status(f"Backend process started (PID: {self.process.pid}).")
 
-        # --- Start Reader Threads ---
-        self.stdout_thread = threading.Thread(target=self._read_stream, args=(self.process.stdout, "stdout"), daemon=True); self.stdout_thread.start()
-        self.stderr_thread = threading.Thread(target=self._read_stream, args=(self.process.stderr, "stderr"), daemon=True); self.stderr_thread.start()
-        self._monitor_process() # Start polling for process exit
+        # --- Start Reader Thread(s) ---
+        if IS_WINDOWS:
+            # Pipe reads block in the CRT on Windows, so keep one thread per stream
+            self.stdout_thread = threading.Thread(target=self._read_stream, args=(self.process.stdout, "stdout"), daemon=True); self.stdout_thread.start()
+            self.stderr_thread = threading.Thread(target=self._read_stream, args=(self.process.stderr, "stderr"), daemon=True); self.stderr_thread.start()
+        else:
+            # POSIX: one thread multiplexes both pipes through a selector
+            self.stdout_thread = threading.Thread(target=self._reader_loop, args=(self.process,), daemon=True); self.stdout_thread.start()
+            self.stderr_thread = None
+        self._line_drain_id = self.after(50, self._drain_line_queue)
+        # One daemon thread blocks in the kernel on process exit; no polling
+        threading.Thread(target=self._wait_process_exit, args=(self.process,), daemon=True).start()
 
     def _read_stream(self, stream, tag):
-        """ Reads output stream line by line and passes to handler """
+        """ Reads the stream in OS-buffer-sized chunks and queues batches of
+            decoded lines. One os.read per pipe-buffer fill replaces one
+            readline + queue put per line, and lines are additionally
+            coalesced for up to 64 lines / 20 ms before each queue put, so a
+            backend that writes-and-flushes line by line still produces one
+            crossing per batch rather than per line. Before each blocking
+            read the pipe is peeked: if nothing is pending, the batch in
+            hand is flushed first, so the tail of a burst is never held
+            across output silence (checkpoints arrive 10 s apart). """
         try:
-            # The 'for line in stream' loop handles blocking reads efficiently
-            for line in iter(stream.readline, ''):
-                if not self.running and not self.process: break # Exit if process stopped externally
-                ln = line.strip();
-                if ln: safe_update(self.handle_backend_output, ln, tag)
-            # Stream closed
-        except ValueError:
-             print(f"Stream {tag} closed (ValueError).") # Can happen during shutdown
+            fd = stream.fileno()
+            handle = msvcrt.get_osfhandle(fd) if IS_WINDOWS else None
+            carry = b""
+            buf = []
+            last_flush = time.monotonic()
+            while True:
+                if buf and handle is not None:
+                    try:
+                        if _winapi.PeekNamedPipe(handle, 0)[0] == 0:
+                            self._line_queue.put((buf, tag))
+                            buf = []
+                            last_flush = time.monotonic()
+                    except OSError:
+                        pass # Pipe broken/closed: let os.read report EOF
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break # Stream closed (EOF)
+                raw_lines = (carry + chunk).split(b'\n')
+                carry = raw_lines.pop() # Incomplete tail, kept for next read
+                buf.extend(ln for ln in
+                           (raw.strip().decode("utf-8", "replace") for raw in raw_lines)
+                           if ln)
+                now = time.monotonic()
+                if buf and (len(buf) >= 64 or now - last_flush > 0.02):
+                    self._line_queue.put((buf, tag))
+                    buf = []
+                    last_flush = now
+                if not self.running and not self.process:
+                    break # Exit if process stopped externally
+            ln = carry.strip().decode("utf-8", "replace")
+            if ln:
+                buf.append(ln)
+            if buf:
+                self._line_queue.put((buf, tag))
+        except (ValueError, OSError):
+             print(f"Stream {tag} closed.") # Can happen during shutdown
         except Exception as e:
              # Avoid printing errors if we stopped intentionally
              if self.running or not self.stopped_by_user:
@@ -983,46 +1506,146 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             except Exception: pass
             # print(f"{tag} reader thread finished.")
 
+    def _reader_loop(self, process):
+        """ POSIX worker: a single thread multiplexes stdout and stderr with
+            a selector instead of dedicating a blocking thread to each pipe.
+            Per-pipe chunking/decoding/coalescing matches _read_stream. """
+        sel = selectors.DefaultSelector()
+        # fd -> [stream, tag, carry, buf, last_flush]
+        pipes = {}
+        for stream, tag in ((process.stdout, "stdout"), (process.stderr, "stderr")):
+            fd = stream.fileno()
+            sel.register(fd, selectors.EVENT_READ)
+            pipes[fd] = [stream, tag, b"", [], time.monotonic()]
+        try:
+            while pipes:
+                ready = sel.select(timeout=0.05)
+                for key, _ in ready:
+                    fd = key.fd
+                    st = pipes[fd]
+                    try:
+                        chunk = os.read(fd, 65536)
+                    except OSError:
+                        chunk = b""
+                    if not chunk:
+                        # EOF: flush the tail and drop this pipe
+                        ln = st[2].strip().decode("utf-8", "replace")
+                        if ln:
+                            st[3].append(ln)
+                        if st[3]:
+                            self._line_queue.put((st[3], st[1]))
+                        sel.unregister(fd)
+                        try: st[0].close()
+                        except Exception: pass
+                        del pipes[fd]
+                        continue
+                    raw_lines = (st[2] + chunk).split(b'\n')
+                    st[2] = raw_lines.pop() # Incomplete tail, kept for next read
+                    st[3].extend(ln for ln in
+                                 (raw.strip().decode("utf-8", "replace") for raw in raw_lines)
+                                 if ln)
+                now = time.monotonic()
+                for st in pipes.values():
+                    # Same 64-line / 20 ms coalescing window as _read_stream;
+                    # the select timeout also ages out idle buffers.
+                    if st[3] and (len(st[3]) >= 64 or now - st[4] > 0.02):
+                        self._line_queue.put((st[3], st[1]))
+                        st[3] = []
+                        st[4] = now
+        except Exception as e:
+            if self.running or not self.stopped_by_user:
+                print(f"Reader loop error: {e}")
+                safe_update(self.update_status, f"[WARN] Error reading backend output: {e}")
+        finally:
+            for st in pipes.values():
+                try: st[0].close()
+                except Exception: pass
+            try: sel.close()
+            except Exception: pass
 
-    def handle_backend_output(self, line: str, tag: str):
-        """ Process lines received from C++ stdout/stderr """
+    def _drain_line_queue(self):
+        """ 50 ms tick: drain queued backend output in batches of up to 200
+            lines and log each batch with a single update_status call. """
+        self._line_drain_id = None
         if not self or not self.winfo_exists(): return # Exit if GUI is gone
 
-        # Log everything unless it's the special FOUND marker
-        if not line.startswith("FOUND:"):
-             self.update_status(line) # Log regular output
-
-        # Check for the password found signal
-        if tag == "stdout" and line.startswith("FOUND:") and self.running and not self.found_password:
-             self.found_password = line[len("FOUND:") :].strip()
-             # Optionally, log the found password here too, masked or clear
-             self.update_status(f"🔑 SUCCESS: Password found: {self.found_password}")
-             # No need to stop here, monitor_process handles termination & popup
-
-    def _monitor_process(self):
-        """ Periodically checks if the C++ process has exited """
-        if not self or not self.winfo_exists(): return # Stop if window closed
-        if not self.running or not self.process:
-             # Ensure UI is re-enabled if monitoring stops unexpectedly while not running
-             if not self.stopped_by_user: self.set_ui_state(True)
-             return
+        batch = []
+        total = 0
+        try:
+            while total < 200:
+                lines, tag = self._line_queue.get_nowait()
+                batch.append((lines, tag))
+                total += len(lines)
+        except queue.Empty:
+            pass
 
+        if batch:
+            out_lines = []
+            for lines, tag in batch:
+                is_stdout = tag == "stdout"
+                for line in lines:
+                    # Check for the password found signal; the one-byte
+                    # quick-reject keeps the common path to a single compare
+                    # instead of a full startswith per progress line.
+                    # found_password doubles as the per-process guard here:
+                    # start_cracking resets it, and the final drain runs
+                    # after self.running has already been cleared.
+                    if (is_stdout and line[:1] == 'F' and line.startswith(_FOUND)
+                            and self.found_password is None):
+                        self.found_password = line[_FOUND_LEN:].strip()
+                        out_lines.append(f"🔑 SUCCESS: Password found: {self.found_password}")
+                        # No need to stop here, _on_process_exited handles termination & popup
+                    else:
+                        out_lines.append(line)
+            self.update_status("\n".join(out_lines))
+
+        # Keep ticking while the backend runs or output is still queued
+        if self.running or not self._line_queue.empty():
+            self._line_drain_id = self.after(50, self._drain_line_queue)
+
+    def _wait_process_exit(self, process):
+        """ Worker thread: blocks on process.wait() until the C++ process
+            exits (terminate/kill from stop_cracking unblocks it too), then
+            posts the exit code to the Tk thread. Replaces the old 500 ms
+            poll loop, so exit is detected immediately and the mainloop is
+            never woken while nothing has happened. """
         try:
-            code = self.process.poll()
+            code = process.wait()
         except Exception as e:
-            self.update_status(f"[ERROR] Failed to poll backend process: {e}")
-            code = -999 # Assign an error code
+            print(f"Process wait error: {e}")
+            code = -999
+        safe_update(self._on_process_exited, process, code)
 
-        if code is None:
-            # Process still running, schedule next check
-            self.monitor_after_id = self.after(500, self._monitor_process) # Check every 500ms
-            return
-        
+    def _on_process_exited(self, process, code):
+        """ Runs on the Tk thread once the backend process has terminated """
+        if not self or not self.winfo_exists(): return # Stop if window closed
+        if process is not self.process: return # Stale exit for a replaced process
 
         # --- Process has Terminated ---
         self.running = False
-        # Wait briefly to catch any final output from reader threads
-        time.sleep(0.2)
+        # Catch any final output: the pipes hit EOF when the process exits,
+        # so the reader threads fall through and these joins return almost
+        # immediately — unlike the unconditional 200 ms sleep they replace.
+        if self.stdout_thread and self.stdout_thread.is_alive(): self.stdout_thread.join(timeout=0.2)
+        if self.stderr_thread and self.stderr_thread.is_alive(): self.stderr_thread.join(timeout=0.2)
+
+        # Flush everything still queued BEFORE reporting: the backend prints
+        # FOUND: and exits immediately, and exit detection is now instant, so
+        # the FOUND batch is typically still waiting for its 50 ms drain
+        # tick at this point. The drain caps itself at 200 lines per call,
+        # hence the loop.
+        if self._line_drain_id:
+            try: self.after_cancel(self._line_drain_id)
+            except Exception: pass
+            self._line_drain_id = None
+        while True:
+            self._drain_line_queue()
+            if self._line_drain_id:
+                try: self.after_cancel(self._line_drain_id)
+                except Exception: pass
+                self._line_drain_id = None
+            if self._line_queue.empty():
+                break
 
         # Determine exit reason for logging
         exit_reason = f"finished with exit code {code}"
@@ -1036,21 +1659,22 @@ class ArchivePasswordCrackerApp(ctk.CTk):
 
         self.update_status(f"--- Backend process {exit_reason} ---")
 
-        # Show final result popup only if not manually stopped by user
-        if not self.stopped_by_user:
-            self.show_final_result_popup(code)
+        # Popup shown only if not manually stopped by user — and only after
+        # cleanup below, because the modal dialog blocks this (Tk) thread and
+        # would otherwise hold the UI in its "running" state with the log
+        # unsaved until dismissed.
+        show_popup = not self.stopped_by_user
 
-        # Cleanup
+        # Cleanup (reader threads joined and queue drained above)
         self.process = None
-        # Threads should exit automatically as streams close, but join defensively
-        if self.stdout_thread and self.stdout_thread.is_alive(): self.stdout_thread.join(timeout=0.1)
-        if self.stderr_thread and self.stderr_thread.is_alive(): self.stderr_thread.join(timeout=0.1)
         self.stdout_thread = None; self.stderr_thread = None
-        self.monitor_after_id = None # Clear scheduled task ID
         self.stopped_by_user = False # Reset flag
         self.set_ui_state(True) # Re-enable UI controls
         self.save_log_to_file()  # Save log when process finishes
 
+        if show_popup:
+            self.show_final_result_popup(code)
+
 
     def show_final_result_popup(self, code):
         """ Displays appropriate message box based on C++ exit code """
@@ -1083,108 +1707,129 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             return
         if self.process.poll() is not None:
             # Process already finished, perhaps between the check and the stop button press.
-            # The _monitor_process loop should handle the cleanup.
+            # The exit-wait thread will deliver _on_process_exited for cleanup.
             self.update_status("Backend process already terminated.")
             # Ensure UI is consistent if monitor hasn't caught up yet
             if self.running:
                  self.running = False
                  self.set_ui_state(True)
             return
+        if self._stop_thread is not None and self._stop_thread.is_alive():
+            self.update_status(">>> Stop sequence already in progress.")
+            return
 
-        self.update_status(">>> Initiating stop sequence...")
+        # Collect the launch-side lines and post them with one update_status
+        msgs = [">>> Initiating stop sequence..."]
         self.stopped_by_user = True  # Set flag immediately
 
         # --- Create stop flag file ONLY if skip list feature is enabled in GUI ---
         stop_flag_path = ""
         # Check if skip list checkbox is ticked AND the global path is set
         if self.skip_var.get() and SKIP_LIST_PATH:
-             stop_flag_path = SKIP_LIST_PATH + ".stop"
+             stop_flag_path = self._stop_flag_path
              try:
                  # Create an empty file to signal stop
                  with open(stop_flag_path, 'w') as f:
                      pass
-                 self.update_status(f">>> Stop flag file created ({os.path.basename(stop_flag_path)}), waiting for graceful backend exit...")
+                 msgs.append(f">>> Stop flag file created ({os.path.basename(stop_flag_path)}), waiting for graceful backend exit...")
              except Exception as e:
-                 self.update_status(f"[ERROR] Could not create stop flag file '{stop_flag_path}': {e}")
+                 msgs.append(f"[ERROR] Could not create stop flag file '{stop_flag_path}': {e}")
                  stop_flag_path = "" # Ensure we don't try to remove it later if creation failed
                  # Proceed to wait/terminate anyway, but backend won't save via flag
-                 self.update_status(">>> Proceeding without stop flag due to creation error.")
+                 msgs.append(">>> Proceeding without stop flag due to creation error.")
         else:
-            self.update_status(">>> Skip list/stop flag feature not enabled. Attempting direct termination...")
+            msgs.append(">>> Skip list/stop flag feature not enabled. Attempting direct termination...")
             # No stop flag to create, will rely on terminate/kill below
+        self.update_status("\n".join(msgs))
+
+        # --- Hand the wait/terminate/kill sequence to a worker thread ---
+        # The old implementation spun a time.sleep(0.1) poll loop on the Tk
+        # thread for up to 8 s, freezing the UI; the worker blocks in the
+        # kernel on process.wait(timeout) instead and posts status updates
+        # back through safe_update.
+        self._stop_thread = threading.Thread(
+            target=self._stop_worker, args=(self.process, stop_flag_path), daemon=True
+        )
+        self._stop_thread.start()
+
+    def _stop_worker(self, process, stop_flag_path):
+        """Worker thread for stop_cracking: waits out the graceful-exit
+           window, escalates to terminate/kill, and removes the stop flag."""
+        status = functools.partial(safe_update, self.update_status)
 
-        # --- Wait for the process to exit gracefully, with an increased timeout ---
-        start_time = time.time()
         graceful_exit_timeout = 8.0 # Increased timeout in seconds (e.g., 8 seconds)
         terminated_gracefully = False
+        try:
+            # Blocks in the kernel (waitpid/WaitForSingleObject); exact exit
+            # detection, no wakeups
+            process.wait(timeout=graceful_exit_timeout)
+            terminated_gracefully = True
+            status(">>> Backend process exited.")
+        except subprocess.TimeoutExpired:
+            status(f">>> Backend did not exit within {graceful_exit_timeout}s timeout.")
+        except Exception as e:
+            status(f"[ERROR] Error waiting for backend exit: {e}")
 
-        while True: # Loop until process exits or timeout occurs
-            if self.process.poll() is not None:
-                # Process exited on its own (hopefully after seeing the flag or finishing)
-                terminated_gracefully = True
-                self.update_status(">>> Backend process exited.")
-                break # Exit the wait loop
-
-            if time.time() - start_time > graceful_exit_timeout:
-                # Timeout reached, backend didn't stop gracefully
-                self.update_status(f">>> Backend did not exit within {graceful_exit_timeout}s timeout.")
-                break # Exit the wait loop
-
-            # Wait a short interval before polling again
-            time.sleep(0.1)
+        # Everything past the graceful window happens within ~0.5 s, so the
+        # remaining transcript is collected locally and posted once.
+        msgs = []
 
         # --- Force termination if it didn't exit gracefully ---
         if not terminated_gracefully:
-            self.update_status(">>> Forcing termination...")
+            msgs.append(">>> Forcing termination...")
             try:
                 # 1. Try SIGTERM first (more graceful)
-                self.process.terminate()
-                self.update_status(">>> Sent SIGTERM/TerminateProcess.")
+                process.terminate()
+                msgs.append(">>> Sent SIGTERM/TerminateProcess.")
                 # Wait briefly for terminate to work
                 try:
-                    self.process.wait(timeout=0.5)
-                    self.update_status(">>> Process terminated successfully after signal.")
+                    process.wait(timeout=0.5)
+                    msgs.append(">>> Process terminated successfully after signal.")
                     terminated_gracefully = True # It reacted to terminate
                 except subprocess.TimeoutExpired:
                     # 2. If terminate didn't work, use SIGKILL (forceful)
-                    self.update_status(">>> Terminate ineffective, sending SIGKILL/KillProcess...")
-                    self.process.kill()
-                    self.update_status(">>> Process forcefully killed.")
+                    msgs.append(">>> Terminate ineffective, sending SIGKILL/KillProcess...")
+                    process.kill()
+                    msgs.append(">>> Process forcefully killed.")
                 except Exception as e_wait:
                     # Catch errors during the wait after terminate
-                    self.update_status(f"[ERROR] Error waiting after terminate: {e_wait}")
+                    msgs.append(f"[ERROR] Error waiting after terminate: {e_wait}")
                     # Assume kill is needed if wait failed
-                    self.update_status(">>> Assuming kill needed after wait error.")
-                    self.process.kill()
-                    self.update_status(">>> Process forcefully killed.")
+                    msgs.append(">>> Assuming kill needed after wait error.")
+                    process.kill()
+                    msgs.append(">>> Process forcefully killed.")
 
             except Exception as e_term:
                 # Catch errors during terminate() or kill() itself
-                self.update_status(f"[ERROR] Failed to terminate/kill process: {e_term}")
+                msgs.append(f"[ERROR] Failed to terminate/kill process: {e_term}")
 
         # --- Remove the stop flag file if it was successfully created ---
         if stop_flag_path:
             try:
-                if os.path.exists(stop_flag_path):
-                    os.remove(stop_flag_path)
-                    self.update_status(f">>> Stop flag file removed ({os.path.basename(stop_flag_path)}).")
-            except Exception as e:
+                # EAFP: one remove syscall instead of an exists + remove pair
+                os.remove(stop_flag_path)
+                msgs.append(f">>> Stop flag file removed ({os.path.basename(stop_flag_path)}).")
+            except FileNotFoundError:
+                pass # Backend already consumed/removed it
+            except OSError as e:
                 # Log error but don't prevent app from continuing
-                self.update_status(f"[WARN] Could not remove stop flag file '{stop_flag_path}': {e}")
+                msgs.append(f"[WARN] Could not remove stop flag file '{stop_flag_path}': {e}")
 
 
-        # --- IMPORTANT: Let _monitor_process handle final cleanup ---
-        # The _monitor_process loop runs independently and will detect the process
-        # termination (whether graceful or forced). It is responsible for:
+        # --- IMPORTANT: Let _on_process_exited handle final cleanup ---
+        # The exit-wait thread blocks on process.wait() independently and will
+        # report the termination (whether graceful or forced). Its callback is
+        # responsible for:
         #   - Setting self.running = False
         #   - Re-enabling the UI (self.set_ui_state(True))
         #   - Performing the final log save (self.save_log_to_file())
         #
-        # Therefore, we DO NOT call those methods directly here in stop_cracking
-        # to avoid race conditions or duplicate actions. We simply ensure the
-        # process is terminated and the flag is removed.
+        # Therefore, we DO NOT call those methods directly here in the stop
+        # sequence to avoid race conditions or duplicate actions. We simply
+        # ensure the process is terminated and the flag is removed.
 
-        self.update_status(">>> Stop sequence complete.")
+        msgs.append(">>> Stop sequence complete.")
+        status("\n".join(msgs))
 
     def on_closing(self):
         """ Handles window close event """
@@ -1192,24 +1837,36 @@ class ArchivePasswordCrackerApp(ctk.CTk):
             if messagebox.askyesno("Exit Confirmation", "The cracking process is still running.\nDo you want to stop it and exit?", icon='warning'):
                 self.update_status(">>> Stopping backend process due to application exit...")
                 self.stop_cracking()
-                # Schedule the final destroy after a short delay to allow monitor loop to process termination
-                self.after(700, self._destroy)
+                # Destroy only once the stop sequence has finished, so the
+                # backend keeps its full graceful window to checkpoint the
+                # skip list instead of being force-killed mid-stop.
+                self.after(200, self._destroy_when_stopped)
             else:
                 return # User cancelled exit
         else:
             self.save_log_to_file()  # Save log before exiting
             self._destroy() # No process running, destroy immediately
 
+    def _destroy_when_stopped(self):
+        """ Polls until the stop worker and exit cleanup are done, then
+            destroys the window. Bounded: the stop worker escalates to kill
+            after its graceful timeout, which unblocks the exit-wait thread
+            and clears self.running. """
+        if (self._stop_thread is not None and self._stop_thread.is_alive()) or self.running:
+            self.after(200, self._destroy_when_stopped)
+            return
+        self._destroy()
+
     def _destroy(self):
         """ Performs final cleanup and destroys the window """
         global app_instance
         print("Destroying application window...")
 
-        # Ensure monitor loop is cancelled
-        if self.monitor_after_id:
-            try: self.after_cancel(self.monitor_after_id)
+        # Close the append-mode log handle
+        if self._log_fp is not None:
+            try: self._log_fp.close()
             except Exception: pass
-            self.monitor_after_id = None
+            self._log_fp = None
 
         # Force kill if process didn't terminate gracefully earlier
         if self.process and self.process.poll() is None:
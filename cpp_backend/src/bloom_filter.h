@@ -1,58 +1,82 @@
-#pragma once
-
-#include <vector>
-#include <string>
-#include <cstdint> // For uint64_t, uint32_t
-#include <cmath>   // For std::log, std::ceil
-#include <fstream> // For file I/O
-#include <stdexcept> // For exceptions
-#include <limits>  // For numeric_limits
-
-// Simple FNV-1a 64-bit hash function
-inline uint64_t fnv1a_hash(const void* key, int len) {
-    uint64_t hash = 0xcbf29ce484222325ULL; // FNV offset basis
-    const unsigned char* p = static_cast<const unsigned char*>(key);
-    for (int i = 0; i < len; ++i) {
-        hash ^= static_cast<uint64_t>(p[i]);
-        hash *= 0x100000001b3ULL; // FNV prime
-    }
-    return hash;
-}
-
-extern std::string skipListFilePath;
-
-class BloomFilter {
-public:
-    // Constructor: Calculates optimal size and hash count
-    BloomFilter(uint64_t estimated_items, double false_positive_rate);
-
-    // Default constructor for deserialization
-    BloomFilter() : m_num_bits(0), m_num_hashes(0), m_estimated_items(0), m_fp_rate(0.0) {}
-
-    // Add an item to the filter
-    void insert(const std::string& item);
-
-    // Check if an item might be in the filter
-    bool contains(const std::string& item) const;
-
-    // Serialize the filter state to a file
-    bool serialize(const std::string& filepath) const;
-
-    // Deserialize the filter state from a file
-    bool deserialize(const std::string& filepath);
-
-    // Getters (optional)
-    uint64_t getNumBits() const { return m_num_bits; }
-    uint32_t getNumHashes() const { return m_num_hashes; }
-    bool isValid() const { return !m_bits.empty() && m_num_hashes > 0; }
-
-private:
-    uint64_t m_num_bits;        // Size of the bit vector (m)
-    uint32_t m_num_hashes;      // Number of hash functions (k)
-    uint64_t m_estimated_items; // Expected number of items (n) - stored for info
-    double m_fp_rate;           // Target false positive rate (p) - stored for info
-    std::vector<bool> m_bits;   // The bit vector
-
-    // Generate k hash values for an item
-    void generate_hashes(const std::string& item, std::vector<uint64_t>& hashes) const;
-};
\ No newline at end of file
+#pragma once
+
+#include <vector>
+#include <string>
+#include <cstdint> // For uint64_t, uint32_t
+#include <cmath>   // For std::log, std::ceil
+#include <fstream> // For file I/O
+#include <stdexcept> // For exceptions
+#include <limits>  // For numeric_limits
+
+// Simple FNV-1a 64-bit hash function
+inline uint64_t fnv1a_hash(const void* key, int len) {
+    uint64_t hash = 0xcbf29ce484222325ULL; // FNV offset basis
+    const unsigned char* p = static_cast<const unsigned char*>(key);
+    for (int i = 0; i < len; ++i) {
+        hash ^= static_cast<uint64_t>(p[i]);
+        hash *= 0x100000001b3ULL; // FNV prime
+    }
+    return hash;
+}
+
+// Derive the double-hashing pair (h1, h2) from a single pass over the key:
+// h1 is FNV-1a over the bytes, h2 a splitmix64 finalizer of h1. Probe i is
+// then (h1 + i*h2), so k probes cost one data pass plus a few multiplies
+// instead of k hash evaluations. The Python BlockedBloom helper mirrors this.
+inline void bloom_hash_pair(const void* key, int len, uint64_t& h1, uint64_t& h2) {
+    h1 = fnv1a_hash(key, len);
+    uint64_t z = h1 + 0x9E3779B97F4A7C15ULL;
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    h2 = z ^ (z >> 31);
+}
+
+extern std::string skipListFilePath;
+
+// Blocked Bloom filter: all k probe bits for a key are confined to one
+// 64-byte (cacheline-sized) block selected by the top bits of h1, so a
+// membership test costs a single cacheline fetch instead of k scattered
+// random accesses across the whole bit vector.
+//
+// On-disk format ("BBF1"): [magic "BBF1"][k:u8][log2_blocks:u8][blocks...]
+// where blocks is (1 << log2_blocks) * 64 bytes.
+class BloomFilter {
+public:
+    static const uint32_t BLOCK_BYTES = 64;
+    static const uint32_t BLOCK_BITS  = BLOCK_BYTES * 8; // 512
+
+    // Constructor: Calculates optimal size and hash count
+    BloomFilter(uint64_t estimated_items, double false_positive_rate);
+
+    // Default constructor for deserialization
+    BloomFilter() : m_num_hashes(0), m_log2_blocks(0), m_estimated_items(0), m_fp_rate(0.0) {}
+
+    // Add an item to the filter
+    void insert(const std::string& item);
+
+    // Check if an item might be in the filter
+    bool contains(const std::string& item) const;
+
+    // Serialize the filter state to a file
+    bool serialize(const std::string& filepath) const;
+
+    // Deserialize the filter state from a file
+    bool deserialize(const std::string& filepath);
+
+    // Getters (optional)
+    uint64_t getNumBits() const { return static_cast<uint64_t>(m_blocks.size()) * 8; }
+    uint32_t getNumHashes() const { return m_num_hashes; }
+    bool isValid() const { return !m_blocks.empty() && m_num_hashes > 0; }
+
+private:
+    uint32_t m_num_hashes;      // Number of probe bits per key (k)
+    uint8_t  m_log2_blocks;     // log2 of the number of 64-byte blocks
+    uint64_t m_estimated_items; // Expected number of items (n) - stored for info
+    double   m_fp_rate;         // Target false positive rate (p) - stored for info
+    std::vector<uint8_t> m_blocks; // (1 << m_log2_blocks) * BLOCK_BYTES bytes
+
+    // Block selected by the high bits of h1 (cheap shift, no modulo)
+    uint64_t block_index(uint64_t h1) const {
+        return m_log2_blocks ? (h1 >> (64 - m_log2_blocks)) : 0;
+    }
+};
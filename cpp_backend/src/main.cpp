@@ -33,6 +33,7 @@ std::string sevenZipPath;
 // Globals for Skip List
 std::string skipListFilePath;
 int checkpointIntervalSeconds = 0;
+double targetFpRate = 0.01; // Target false-positive rate for a new skip list
 BloomFilter skipFilter;
 std::mutex skipFilterMutex;
 
@@ -144,7 +145,7 @@ int main(int argc, char *argv[]) {
         std::cerr << "ERROR: Insufficient arguments." << std::endl;
         std::cerr << "Usage: " << (argc > 0 ? argv[0] : "ArchivePasswordCrackerCLI")
                   << " <charset> <min_length> <max_length> <archive_path> <ascending|descending|random>"
-                  << " [--skip-file <path>] [--checkpoint-interval <seconds>]" << std::endl;
+                  << " [--skip-file <path>] [--checkpoint-interval <seconds>] [--fp-rate <0..1>]" << std::endl;
         update_output("ERROR: Invalid number of required arguments provided to C++ backend. Expected at least 5.");
         return 2; // Argument error exit code
     }
@@ -167,6 +168,17 @@ int main(int argc, char *argv[]) {
                 std::cerr << "WARN: Invalid checkpoint interval value ('" << argv[i] << "'), using 0 (disabled). Error: " << e.what() << std::endl;
                 checkpointIntervalSeconds = 0;
             }
+        } else if ((arg == "--fp-rate" || arg == "-f") && i + 1 < argc) {
+            try {
+                targetFpRate = std::stod(argv[++i]);
+                if (targetFpRate <= 0.0 || targetFpRate >= 1.0) {
+                    std::cerr << "WARN: FP rate must be in (0, 1), using default 0.01." << std::endl;
+                    targetFpRate = 0.01;
+                }
+            } catch (const std::exception& e) {
+                std::cerr << "WARN: Invalid FP rate value ('" << argv[i] << "'), using default 0.01. Error: " << e.what() << std::endl;
+                targetFpRate = 0.01;
+            }
         } else {
             std::cerr << "WARN: Ignoring unknown or misplaced optional argument: '" << arg << "'" << std::endl;
         }
@@ -394,7 +406,7 @@ int main(int argc, char *argv[]) {
             else
             {
                 // *** ADDED MEMORY CHECK ***
-                double fp_rate = 0.01;
+                double fp_rate = targetFpRate;
                 // Calculate m_num_bits *tentatively* based on estimated_items and fp_rate
                 double m_exact_check = 0;
                 if (estimated_items_in_range > 0)
@@ -402,8 +414,17 @@ int main(int argc, char *argv[]) {
                     m_exact_check = -(static_cast<double>(estimated_items_in_range) * std::log(fp_rate)) / (std::log(2.0) * std::log(2.0));
                 }
                 uint64_t tentative_num_bits = static_cast<uint64_t>(std::ceil(m_exact_check));
-                if (tentative_num_bits < 8)
-                    tentative_num_bits = 8; // Apply min size
+                // Mirror the constructor's sizing exactly: at least one
+                // 64-byte block, block count rounded up to a power of two.
+                // Checking the raw estimate would let a filter pass the cap
+                // and then allocate up to 2x the checked size.
+                if (tentative_num_bits < BloomFilter::BLOCK_BITS)
+                    tentative_num_bits = BloomFilter::BLOCK_BITS;
+                uint64_t wanted_blocks_check = (tentative_num_bits + BloomFilter::BLOCK_BITS - 1) / BloomFilter::BLOCK_BITS;
+                uint8_t log2_blocks_check = 0;
+                while ((1ULL << log2_blocks_check) < wanted_blocks_check && log2_blocks_check < 57)
+                    ++log2_blocks_check;
+                tentative_num_bits = (1ULL << log2_blocks_check) * BloomFilter::BLOCK_BITS;
 
                 // Define a reasonable memory limit (e.g., 4GB for the bit vector)
                 const uint64_t MAX_FILTER_BITS = 4ULL * 1024 * 1024 * 1024 * 8; // 4 Gigabytes in bits